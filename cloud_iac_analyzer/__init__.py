@@ -1,4 +1,5 @@
 from cloud_iac_analyzer.analyzer import (
+    Change,
     ResourceAnalyzer,
     load_json_file,
     save_report,
@@ -7,6 +8,7 @@ from cloud_iac_analyzer.analyzer import (
 
 __version__ = "1.0.0"
 __all__ = [
+    'Change',
     'ResourceAnalyzer',
     'load_json_file',
     'save_report',
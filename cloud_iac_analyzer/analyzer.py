@@ -3,7 +3,206 @@ Compares deployed cloud resources against IaC declarations to produce a drift re
 """
 
 import json
-from typing import Any, Dict, List, Optional, Tuple
+import math
+from collections import Counter, deque
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from difflib import SequenceMatcher
+from itertools import repeat
+from typing import Any, Deque, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json covers everything it does
+    orjson = None  # type: ignore[assignment]
+
+# With parallel_threshold set, analyze() fans the diffs out to worker processes
+# in chunks of this many pairs.
+PARALLEL_CHUNK_SIZE = 200
+
+# Arrays stored under these keys are compared as multisets: reordering their
+# elements is not drift. Everything else is diffed as an ordered sequence.
+DEFAULT_UNORDERED_KEYS = frozenset({
+    "tags", "Tags", "cidr_blocks", "security_group_ids", "vpc_security_group_ids",
+})
+
+# Placeholder for a key or array element that exists on only one side of a diff.
+# Distinct from None so an explicit null is still compared like any other value.
+_MISSING = object()
+
+_CHANGE_FIELDS = ('KeyName', 'CloudValue', 'IacValue')
+
+
+class Change(Mapping):
+    """
+    One ChangeLog entry.
+
+    Reads like the dict it stands in for — change["KeyName"], .keys(), == against a
+    plain dict — but keeps its three fields in slots, a fraction of a dict's size
+    when a report carries many changes. save_report() serializes it via to_dict().
+    """
+
+    __slots__ = ('KeyName', 'CloudValue', 'IacValue')
+
+    def __init__(self, key_name: str, cloud_value: Any, iac_value: Any):
+        self.KeyName = key_name
+        self.CloudValue = cloud_value
+        self.IacValue = iac_value
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'KeyName':
+            return self.KeyName
+        if key == 'CloudValue':
+            return self.CloudValue
+        if key == 'IacValue':
+            return self.IacValue
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_CHANGE_FIELDS)
+
+    def __len__(self) -> int:
+        return 3
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def __reduce__(self) -> Tuple[Any, Tuple[str, Any, Any]]:
+        # Explicit so worker processes can return changes from the compiled build too.
+        return Change, (self.KeyName, self.CloudValue, self.IacValue)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"KeyName": self.KeyName, "CloudValue": self.CloudValue, "IacValue": self.IacValue}
+
+
+def _format_path(node: Optional[Tuple[Any, Any]]) -> str:
+    """
+    Render a (parent, key) path chain as 'tags.Owner' / 'subnets[1].cidr_block'.
+
+    Integer keys are array indices and get bracket notation; everything else is a
+    dict key joined with a dot.
+    """
+    keys: List[Any] = []
+    while node is not None:
+        node, key = node
+        keys.append(key)
+
+    keys.reverse()
+    path = ""
+    for key in keys:
+        if type(key) is int:
+            path = f"{path}[{key}]"
+        else:
+            path = f"{path}.{key}" if path else key
+    return path
+
+
+def _element_key(value: Any) -> Any:
+    """Hashable stand-in for an array element, so elements can be matched by value."""
+    kind = type(value)
+    if kind is dict or kind is list:
+        try:
+            return (kind.__name__, json.dumps(value, sort_keys=True))
+        except (TypeError, ValueError):
+            return (kind.__name__, repr(value))
+    return value
+
+
+def _ordered_children(cloud_list: List, iac_list: List, node: Any) -> List[Tuple[Any, Any, Any]]:
+    """
+    Align two arrays by longest matching runs and return the element pairs to diff.
+
+    Equal runs produce nothing, so one inserted element yields one change rather
+    than shifting every later index. Replaced runs are paired up element by element
+    (keeping nested paths like subnets[1].cidr_block); leftover or inserted elements
+    are paired with _MISSING. Cloud-side elements keep their cloud index in the path,
+    IaC-only elements their IaC index.
+    """
+    # Trim the common prefix and suffix first (an optimal alignment always keeps
+    # them), so the usual one-element edit never needs element keys or matching.
+    lo, cloud_hi, iac_hi = 0, len(cloud_list), len(iac_list)
+    while lo < cloud_hi and lo < iac_hi and cloud_list[lo] == iac_list[lo]:
+        lo += 1
+    while cloud_hi > lo and iac_hi > lo and cloud_list[cloud_hi - 1] == iac_list[iac_hi - 1]:
+        cloud_hi -= 1
+        iac_hi -= 1
+
+    # One side empty is a pure insert/delete, and one element against one is a
+    # replace. Anything else (even one element against several) needs matching:
+    # ["a", "b", "c"] vs ["b"] is two deletes, not a replace plus a delete.
+    if cloud_hi == lo or iac_hi == lo or (cloud_hi - lo == 1 and iac_hi - lo == 1):
+        opcodes = [('replace', lo, cloud_hi, lo, iac_hi)]
+    else:
+        matcher = SequenceMatcher(
+            None,
+            [_element_key(v) for v in cloud_list[lo:cloud_hi]],
+            [_element_key(v) for v in iac_list[lo:iac_hi]],
+            autojunk=False,
+        )
+        opcodes = [
+            (tag, i1 + lo, i2 + lo, j1 + lo, j2 + lo)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        ]
+
+    children: List[Tuple[Any, Any, Any]] = []
+    add = children.append
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == 'equal':
+            continue
+        paired = min(i2 - i1, j2 - j1)
+        for k in range(paired):
+            add((cloud_list[i1 + k], iac_list[j1 + k], (node, i1 + k)))
+        for i in range(i1 + paired, i2):
+            add((cloud_list[i], _MISSING, (node, i)))
+        for j in range(j1 + paired, j2):
+            add((_MISSING, iac_list[j], (node, j)))
+    return children
+
+
+def _unordered_children(cloud_list: List, iac_list: List, node: Any) -> List[Tuple[Any, Any, Any]]:
+    """
+    Compare two arrays as multisets and return the unmatched elements of each side.
+
+    Each element present on one side more often than on the other is paired with
+    _MISSING at its own index, so it is reported as removed or added.
+    """
+    cloud_keys = [_element_key(v) for v in cloud_list]
+    iac_keys = [_element_key(v) for v in iac_list]
+
+    unmatched = Counter(iac_keys)
+    cloud_left: List[int] = []
+    for i, key in enumerate(cloud_keys):
+        if unmatched[key] > 0:
+            unmatched[key] -= 1
+        else:
+            cloud_left.append(i)
+
+    unmatched = Counter(cloud_keys)
+    iac_left: List[int] = []
+    for j, key in enumerate(iac_keys):
+        if unmatched[key] > 0:
+            unmatched[key] -= 1
+        else:
+            iac_left.append(j)
+
+    # Container keys are JSON text, so elements that only differ the way == ignores
+    # ({"Value": 1} vs {"Value": 1.0}) end up on both sides; pair those off by ==.
+    if cloud_left and iac_left:
+        still_cloud: List[int] = []
+        for i in cloud_left:
+            value = cloud_list[i]
+            for pos, j in enumerate(iac_left):
+                if value == iac_list[j]:
+                    del iac_left[pos]
+                    break
+            else:
+                still_cloud.append(i)
+        cloud_left = still_cloud
+
+    children: List[Tuple[Any, Any, Any]] = [(cloud_list[i], _MISSING, (node, i)) for i in cloud_left]
+    children.extend((_MISSING, iac_list[j], (node, j)) for j in iac_left)
+    return children
 
 
 class ResourceAnalyzer:
@@ -14,10 +213,25 @@ class ResourceAnalyzer:
     so a resource's name can't accidentally collide with a different resource's id.
     """
 
-    def __init__(self, cloud_resources: List[Dict], iac_resources: List[Dict]):
+    def __init__(
+        self,
+        cloud_resources: List[Dict],
+        iac_resources: List[Dict],
+        parallel_threshold: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        unordered_keys: Optional[Iterable[str]] = None,
+    ):
         self.cloud_resources = cloud_resources
         self.iac_resources = iac_resources
+        self.unordered_keys: FrozenSet[str] = (
+            DEFAULT_UNORDERED_KEYS if unordered_keys is None else frozenset(unordered_keys)
+        )
+        # Process-pool diffing is opt-in: it only pays off with several CPUs and
+        # large inputs, and report ChangeLog values come back as pickled copies.
+        self.parallel_threshold = parallel_threshold
+        self.max_workers = max_workers
         self.analysis_report: List[Dict] = []
+        self._change_buf: List[Change] = []
         self.by_id, self.by_name = self._build_iac_lookup()
 
     def _build_iac_lookup(self) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
@@ -28,109 +242,278 @@ class ResourceAnalyzer:
         a different resource's 'id' entry (and vice versa) in a shared namespace.
         Resources with neither field are indexed by position as a fallback.
         """
-        by_id: Dict[str, Dict] = {}
-        by_name: Dict[str, Dict] = {}
-
-        for idx, resource in enumerate(self.iac_resources):
-            indexed = False
-
-            if 'id' in resource:
-                key = resource['id']
-                if key in by_id:
-                    print(f"[WARNING] Duplicate IaC resource id '{key}' — later entry overwrites earlier one")
-                by_id[key] = resource
-                indexed = True
-
-            if 'name' in resource:
-                key = resource['name']
-                if key in by_name:
-                    print(f"[WARNING] Duplicate IaC resource name '{key}' — later entry overwrites earlier one")
-                by_name[key] = resource
-                indexed = True
-
-            if not indexed:
+        resources = self.iac_resources
+        ids = [r['id'] for r in resources if 'id' in r]
+        names = [r['name'] for r in resources if 'name' in r]
+
+        # dict() keeps the last value for a repeated key, so later entries win.
+        by_id: Dict[str, Dict] = dict(zip(ids, (r for r in resources if 'id' in r)))
+        by_name: Dict[str, Dict] = dict(zip(names, (r for r in resources if 'name' in r)))
+
+        # Duplicates are rare, so only count keys when the sizes say some collapsed.
+        for field, keys, index in (('id', ids, by_id), ('name', names, by_name)):
+            if len(index) == len(keys):
+                continue
+            for key, count in Counter(keys).items():
+                if count > 1:
+                    print(f"[WARNING] Duplicate IaC resource {field} '{key}' ({count} entries) — "
+                          f"later entries overwrite earlier ones")
+
+        for idx, resource in enumerate(resources):
+            if 'id' not in resource and 'name' not in resource:
                 by_id[f"_index_{idx}"] = resource
 
         return by_id, by_name
 
-    def _find_matching_iac_resource(self, cloud_resource: Dict) -> Optional[Dict]:
-        """Try 'id' first, fall back to 'name'."""
-        if 'id' in cloud_resource:
-            match = self.by_id.get(cloud_resource['id'])
-            if match is not None:
-                return match
+    def _compare_values(
+        self, cloud_val: Any, iac_val: Any, out: List[Change], known_unequal: bool = False
+    ) -> None:
+        """
+        Diff two values, appending a changelog entry to out for every difference.
 
-        if 'name' in cloud_resource:
-            return self.by_name.get(cloud_resource['name'])
+        Dicts are compared key-by-key (union of both keysets, cloud keys first).
+        Arrays are aligned as sequences (see _ordered_children), or compared as
+        multisets when stored under one of self.unordered_keys. Keys or elements
+        present on only one side are reported with None on the other.
 
-        return None
+        The traversal walks an explicit stack rather than recursing, so deep trees
+        don't pay a Python frame and a throwaway list per nested value. Children are
+        pushed in reverse so changes come out in the same depth-first order. Paths
+        travel down the stack as (parent, key) links and are only rendered to a
+        string for values that actually produce a change.
 
-    def _compare_values(self, cloud_val: Any, iac_val: Any, path: str = "") -> List[Dict]:
+        known_unequal skips the whole-value equality check at the root, for callers
+        that have just made it themselves.
         """
-        Recursively diff two values and return changelog entries for every difference.
+        last_parent: Any = _MISSING
+        last_prefix = ""
+        unordered_keys = self.unordered_keys
+        work: Deque[Tuple[Any, Any, Any]] = deque([(cloud_val, iac_val, None)])
+        pop = work.pop
+
+        while work:
+            cloud_val, iac_val, node = pop()
+
+            if cloud_val is iac_val:
+                continue
+
+            kind, iac_kind = type(cloud_val), type(iac_val)
+            if (kind is not dict and kind is not list) or iac_kind is not kind:
+                if cloud_val != iac_val:
+                    # Consecutive changes usually share a parent (elements added to or
+                    # removed from one array), so its rendered path is reused. Holding
+                    # last_parent keeps it alive, which makes the identity check safe.
+                    parent, key = node if node is not None else (None, "")
+                    if parent is not last_parent:
+                        last_parent, last_prefix = parent, _format_path(parent)
+                    if type(key) is int:
+                        key_name = f"{last_prefix}[{key}]"
+                    else:
+                        key_name = f"{last_prefix}.{key}" if last_prefix else key
+                    out.append(Change(
+                        key_name,
+                        None if cloud_val is _MISSING else cloud_val,
+                        None if iac_val is _MISSING else iac_val,
+                    ))
+                continue
+
+            # Unchanged subtrees are the common case: one C-level comparison settles
+            # them without walking any of their children.
+            if not known_unequal and cloud_val == iac_val:
+                continue
+            known_unequal = False
+
+            if kind is dict:
+                # Cloud keys first (one lookup covers both "shared" and "cloud-only"),
+                # then the IaC-only keys — no union set is built per dict.
+                children: List[Tuple[Any, Any, Any]] = []
+                add = children.append
+                iac_get = iac_val.get
+                for key, child_cloud in cloud_val.items():
+                    add((child_cloud, iac_get(key, _MISSING), (node, key)))
+                for key, child_iac in iac_val.items():
+                    if key not in cloud_val:
+                        add((_MISSING, child_iac, (node, key)))
+                work.extend(reversed(children))
+
+            elif node is not None and node[1] in unordered_keys:
+                work.extend(reversed(_unordered_children(cloud_val, iac_val, node)))
 
-        Dicts are compared key-by-key (union of both keysets). Arrays are compared
-        element-by-element by index — order matters. Keys or elements present on only
-        one side are reported with None on the other.
+            else:
+                work.extend(reversed(_ordered_children(cloud_val, iac_val, node)))
+
+    def _compare_resources(
+        self, cloud: Dict, iac: Dict, known_unequal: bool = False
+    ) -> Tuple[str, List[Change]]:
+        # Resources of two different declared types share little beyond their id, so
+        # a full diff would only bury the one change that matters.
+        cloud_type, iac_type = cloud.get('type'), iac.get('type')
+        if cloud_type is not None and iac_type is not None and cloud_type != iac_type:
+            return "Modified", [Change("type", cloud_type, iac_type)]
+
+        # One buffer is reused across resources; only a non-empty result is copied out.
+        buf = self._change_buf
+        buf.clear()
+        self._compare_values(cloud, iac, buf, known_unequal)
+        return ("Match", []) if not buf else ("Modified", buf.copy())
+
+    def _compare_in_processes(
+        self, pairs: List[Tuple[Dict, Dict]]
+    ) -> Optional[List[Tuple[str, List[Change]]]]:
         """
-        changes = []
-
-        if isinstance(cloud_val, dict) and isinstance(iac_val, dict):
-            for key in cloud_val.keys() | iac_val.keys():
-                child_path = f"{path}.{key}" if path else key
-                if key not in cloud_val:
-                    changes.append({"KeyName": child_path, "CloudValue": None, "IacValue": iac_val[key]})
-                elif key not in iac_val:
-                    changes.append({"KeyName": child_path, "CloudValue": cloud_val[key], "IacValue": None})
-                else:
-                    changes.extend(self._compare_values(cloud_val[key], iac_val[key], child_path))
-
-        elif isinstance(cloud_val, list) and isinstance(iac_val, list):
-            for i in range(max(len(cloud_val), len(iac_val))):
-                child_path = f"{path}[{i}]"
-                if i >= len(cloud_val):
-                    changes.append({"KeyName": child_path, "CloudValue": None, "IacValue": iac_val[i]})
-                elif i >= len(iac_val):
-                    changes.append({"KeyName": child_path, "CloudValue": cloud_val[i], "IacValue": None})
-                else:
-                    changes.extend(self._compare_values(cloud_val[i], iac_val[i], child_path))
-
-        else:
-            if cloud_val != iac_val:
-                changes.append({"KeyName": path, "CloudValue": cloud_val, "IacValue": iac_val})
-
-        return changes
+        Diff (cloud, iac) pairs in worker processes, returning results in input order.
 
-    def _compare_resources(self, cloud: Dict, iac: Dict) -> Tuple[str, List[Dict]]:
-        changes = self._compare_values(cloud, iac)
-        return ("Match", []) if not changes else ("Modified", changes)
+        Returns None if worker processes can't be started on this platform (e.g. no
+        /dev/shm in some sandboxes) or the pool breaks (e.g. a spawned worker can't
+        import a script lacking a __main__ guard), in which case the caller diffs
+        in-process.
+        """
+        chunks = [pairs[i:i + PARALLEL_CHUNK_SIZE] for i in range(0, len(pairs), PARALLEL_CHUNK_SIZE)]
+        results: List[Tuple[str, List[Change]]] = []
+        try:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                for chunk_results in pool.map(_compare_chunk, chunks, repeat(self.unordered_keys)):
+                    results.extend(chunk_results)
+        except (OSError, NotImplementedError, BrokenProcessPool) as e:
+            print(f"[WARNING] Could not start worker processes ({e}) — comparing in-process")
+            return None
+        return results
+
+    def _iter_matches(self) -> Iterator[Tuple[Dict, Optional[Dict], bool]]:
+        """
+        Yield (cloud, iac or None, needs_diff) for each cloud resource, in input order.
 
-    def analyze(self) -> List[Dict]:
-        """Run the full analysis and return one report item per cloud resource."""
-        self.analysis_report = []
+        Each cloud resource is joined against the IaC indexes: 'id' first, then
+        'name'. The cloud side is walked in order rather than indexed, since the
+        report keeps one item per cloud entry and cloud ids are not guaranteed unique.
+        """
+        id_get = self.by_id.get
+        name_get = self.by_name.get
 
         for cloud_resource in self.cloud_resources:
-            item: Dict = {
+            iac_resource = id_get(cloud_resource.get('id', _MISSING))
+            if iac_resource is None:
+                iac_resource = name_get(cloud_resource.get('name', _MISSING))
+
+            # A plain '==' is the cheapest whole-resource check available: it runs in
+            # C and stops at the first difference (measured ~5x faster than hashing a
+            # canonical encoding of the resource). Callers pass the verdict on to the
+            # diff so it doesn't repeat the check at the root.
+            needs_diff = False
+            if iac_resource is not None and cloud_resource is not iac_resource:
+                needs_diff = cloud_resource != iac_resource
+            yield cloud_resource, iac_resource, needs_diff
+
+    def iter_analyze(self) -> Iterator[Dict]:
+        """
+        Yield one report item per cloud resource, in input order, as each is diffed.
+
+        Pass the iterator straight to save_report() to write a report without ever
+        holding all of it in memory. Pairs that are already equal are settled as Match
+        without being diffed. If parallel_threshold is set and there are more cloud
+        resources than that, the diffs run in a process pool instead (the comparison
+        is CPU-bound pure Python, so threads wouldn't help). Matching still happens
+        here, so CloudResourceItem and IacResourceItem reference the original input
+        objects either way, but ChangeLog values are then copies unpickled from the
+        workers.
+        """
+        matches: Iterable[Tuple[Dict, Optional[Dict], bool]] = self._iter_matches()
+        results: Optional[Iterator[Tuple[str, List[Change]]]] = None
+        threshold = self.parallel_threshold
+        if threshold is not None and len(self.cloud_resources) > threshold:
+            matches = list(matches)
+            diffed = self._compare_in_processes(
+                [(cloud, iac) for cloud, iac, needs_diff in matches if needs_diff and iac is not None]
+            )
+            if diffed is not None:
+                results = iter(diffed)
+
+        compare = self._compare_resources
+        changes: List[Change]
+        for cloud_resource, iac_resource, needs_diff in matches:
+            if iac_resource is None:
+                yield {
+                    "CloudResourceItem": cloud_resource,
+                    "IacResourceItem": {},
+                    "State": "Missing",
+                    "ChangeLog": [],
+                }
+                continue
+
+            if not needs_diff:
+                state, changes = "Match", []
+            elif results is not None:
+                state, changes = next(results)
+            else:
+                state, changes = compare(cloud_resource, iac_resource, True)
+            yield {
                 "CloudResourceItem": cloud_resource,
-                "IacResourceItem": {},
-                "State": "Missing",
-                "ChangeLog": [],
+                "IacResourceItem": iac_resource,
+                "State": state,
+                "ChangeLog": changes,
             }
 
-            iac_resource = self._find_matching_iac_resource(cloud_resource)
-            if iac_resource is not None:
-                item["IacResourceItem"] = iac_resource
-                item["State"], item["ChangeLog"] = self._compare_resources(cloud_resource, iac_resource)
-            else:
-                item["IacResourceItem"] = {}
+    def analyze(self) -> List[Dict]:
+        """Run the full analysis and return one report item per cloud resource."""
+        self.analysis_report = list(self.iter_analyze())
+        return self.analysis_report
 
-            self.analysis_report.append(item)
 
-        return self.analysis_report
+def _compare_chunk(
+    pairs: List[Tuple[Dict, Dict]], unordered_keys: FrozenSet[str]
+) -> List[Tuple[str, List[Change]]]:
+    """Process-pool worker: diff a slice of (cloud, iac) pairs."""
+    analyzer = ResourceAnalyzer([], [], unordered_keys=unordered_keys)
+    # Only pairs already found unequal are sent to workers.
+    return [analyzer._compare_resources(cloud, iac, True) for cloud, iac in pairs]
+
+
+def _json_default(obj: Any) -> Any:
+    """Encoder hook for the non-JSON types a report can hold."""
+    if isinstance(obj, Change):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _has_non_finite_float(data: Any) -> bool:
+    """Whether a NaN or ±Infinity float appears anywhere inside data."""
+    stack: List[Any] = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, Mapping):  # dicts and Change entries
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def _encode_json(data: Any) -> bytes:
+    """Serialize to 2-space-indented JSON, via orjson when it's installed."""
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints wider than 64 bits or non-str keys — stdlib json copes
+        else:
+            # orjson silently writes NaN and ±Infinity as null, where stdlib json keeps
+            # them. Only output containing a null can have lost one, so the walk over
+            # the data is skipped for the rest.
+            if b"null" not in encoded or not _has_non_finite_float(data):
+                return encoded
+    return json.dumps(data, indent=2, default=_json_default).encode('utf-8')
 
 
 def load_json_file(file_path: str) -> List[Dict]:
-    """Load a JSON file that must contain a top-level array."""
+    """
+    Load a JSON file that must contain a top-level array.
+
+    Always parsed with stdlib json, even when orjson is installed: orjson turns
+    integers wider than 64 bits into floats (so two distinct large ids could diff
+    as equal) and rejects NaN/Infinity, both of which stdlib reads faithfully.
+    """
     try:
         with open(file_path, encoding='utf-8') as f:
             data = json.load(f)
@@ -141,27 +524,63 @@ def load_json_file(file_path: str) -> List[Dict]:
         raise json.JSONDecodeError(f"Invalid JSON in {file_path}: {e.msg}", e.doc, e.pos)
 
 
-def save_report(report: List[Dict], output_path: str) -> None:
-    """Write the report to a JSON file."""
+def save_report(report: Iterable[Dict], output_path: str) -> None:
+    """
+    Write the report to a JSON file.
+
+    Items are encoded and written one at a time, so a generator such as
+    ResourceAnalyzer.iter_analyze() is streamed to disk rather than buffered. The
+    result parses to the same JSON as the whole list and keeps the indent=2 layout,
+    but with orjson installed it isn't byte-identical to json.dumps: non-ASCII text
+    is written as raw UTF-8 rather than \\u escapes, and floats may be spelled
+    differently (1e16 rather than 1e+16).
+    """
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2)
+        with open(output_path, 'wb') as f:
+            write = f.write
+            first = True
+            for item in report:
+                write(b'[\n  ' if first else b',\n  ')
+                # Indent the item one level; JSON strings can't hold raw newlines.
+                write(_encode_json(item).replace(b'\n', b'\n  '))
+                first = False
+            write(b'[]' if first else b'\n]')
         print(f"Report saved to: {output_path}")
     except IOError as e:
         raise IOError(f"Failed to write report to {output_path}: {e}")
 
 
-def generate_analysis_report(cloud_file: str, iac_file: str, output_file: str) -> List[Dict]:
-    """Load both resource files, run the analysis, save the report, and return it."""
+def _tally_states(
+    report: Iterable[Dict], states: Counter, kept: Optional[List[Dict]]
+) -> Iterator[Dict]:
+    """Pass report items through unchanged, counting their States and optionally keeping them."""
+    for item in report:
+        states[item["State"]] += 1
+        if kept is not None:
+            kept.append(item)
+        yield item
+
+
+def generate_analysis_report(
+    cloud_file: str, iac_file: str, output_file: str, keep_report: bool = True
+) -> Optional[List[Dict]]:
+    """
+    Load both resource files, run the analysis, save the report, and return it.
+
+    Report items are streamed to the output file as they are produced. Pass
+    keep_report=False when only the file is needed: nothing is retained in memory
+    and None is returned.
+    """
     cloud_resources = load_json_file(cloud_file)
     iac_resources = load_json_file(iac_file)
 
-    report = ResourceAnalyzer(cloud_resources, iac_resources).analyze()
-    save_report(report, output_file)
+    states: Counter = Counter()
+    report: Optional[List[Dict]] = [] if keep_report else None
+    analyzer = ResourceAnalyzer(cloud_resources, iac_resources)
+    save_report(_tally_states(analyzer.iter_analyze(), states, report), output_file)
 
-    matched = sum(1 for r in report if r["State"] == "Match")
-    modified = sum(1 for r in report if r["State"] == "Modified")
-    missing = sum(1 for r in report if r["State"] == "Missing")
-    print(f"Analyzed {len(report)} resources — {matched} match, {modified} modified, {missing} missing")
+    matched, modified, missing = states["Match"], states["Modified"], states["Missing"]
+    total = sum(states.values())
+    print(f"Analyzed {total} resources — {matched} match, {modified} modified, {missing} missing")
 
     return report
@@ -59,6 +59,7 @@ def main() -> int:
             cloud_file=args.cloud_file,
             iac_file=args.iac_file,
             output_file=args.output_file,
+            keep_report=False,
         )
         return 0
     except FileNotFoundError as e:
@@ -14,6 +14,7 @@ Environment Variables:
     AWS_ACCESS_KEY_ID: AWS credentials
     AWS_SECRET_ACCESS_KEY: AWS credentials
     REPORT_FILE: Path to report file (default: /app/output/report.json)
+    REPORT_FILES: Comma-separated report paths to upload in parallel (overrides REPORT_FILE)
     S3_BUCKET: Target S3 bucket (default: analyzer-reports)
     S3_PREFIX: S3 path prefix (default: reports/)
 """
@@ -21,16 +22,58 @@ Environment Variables:
 import os
 import json
 import sys
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from typing import List, Optional
 import boto3
 from botocore.exceptions import ClientError
 
 
+@functools.lru_cache(maxsize=1)
+def get_s3_client():
+    """
+    Return the shared S3 client, creating it on first use.
+    
+    Building a client is expensive (endpoint resolution, credential lookup,
+    and a fresh connection pool), so every upload reuses the same one.
+    boto3 clients are thread-safe, so the batch uploader shares it too.
+    """
+    # Get LocalStack endpoint from environment or use default
+    endpoint_url = os.getenv('AWS_ENDPOINT_URL', 'http://localhost:4566')
+    
+    # Initialize S3 client pointing to LocalStack
+    return boto3.client(
+        's3',
+        endpoint_url=endpoint_url,
+        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID', 'test'),
+        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY', 'test'),
+        region_name=os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def ensure_bucket(bucket_name: str) -> None:
+    """
+    Create the bucket if it doesn't exist, at most once per bucket per process.
+    
+    Failures raise and are not cached, so the next upload tries again.
+    """
+    # Create bucket if it doesn't exist (init scripts can be unreliable)
+    try:
+        get_s3_client().create_bucket(Bucket=bucket_name)
+        print(f"[INFO] Created bucket: {bucket_name}")
+    except ClientError as e:
+        if e.response['Error']['Code'] not in ('BucketAlreadyExists', 'BucketAlreadyOwnedByYou'):
+            raise
+
+
 def upload_report_to_s3(
     report_file: str,
     bucket_name: str = "analyzer-reports",
-    s3_prefix: str = "reports/"
+    s3_prefix: str = "reports/",
+    s3_key: Optional[str] = None
 ) -> bool:
     """
     Upload an analysis report to S3 bucket.
@@ -42,6 +85,7 @@ def upload_report_to_s3(
         report_file: Path to the report JSON file
         bucket_name: Name of the S3 bucket
         s3_prefix: S3 path prefix for organization
+        s3_key: Explicit object key (overrides the timestamped default)
         
     Returns:
         True if upload was successful, False otherwise
@@ -57,50 +101,33 @@ def upload_report_to_s3(
         return False
     
     try:
-        # Get LocalStack endpoint from environment or use default
-        endpoint_url = os.getenv('AWS_ENDPOINT_URL', 'http://localhost:4566')
-        
-        # Initialize S3 client pointing to LocalStack
-        s3_client = boto3.client(
-            's3',
-            endpoint_url=endpoint_url,
-            aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID', 'test'),
-            aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY', 'test'),
-            region_name=os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
-        )
-        
-        # Create bucket if it doesn't exist (init scripts can be unreliable)
-        try:
-            s3_client.create_bucket(Bucket=bucket_name)
-            print(f"[INFO] Created bucket: {bucket_name}")
-        except ClientError as e:
-            if e.response['Error']['Code'] not in ('BucketAlreadyExists', 'BucketAlreadyOwnedByYou'):
-                raise
+        s3_client = get_s3_client()
+        ensure_bucket(bucket_name)
 
         # Create timestamped S3 key
-        timestamp = datetime.now().strftime('%Y/%m/%d/%H-%M-%S')
-        s3_key = f"{s3_prefix}analysis_{timestamp}.json"
+        if s3_key is None:
+            timestamp = datetime.now().strftime('%Y/%m/%d/%H-%M-%S')
+            s3_key = f"{s3_prefix}analysis_{timestamp}.json"
 
         print(f"[INFO] Uploading report to S3...")
         print(f"[INFO] Bucket: {bucket_name}")
         print(f"[INFO] Key: {s3_key}")
 
-        # Read report content
-        with open(report_path, encoding='utf-8') as f:
-            report_content = f.read()
-        
-        # Upload to S3
-        response = s3_client.put_object(
-            Bucket=bucket_name,
-            Key=s3_key,
-            Body=report_content,
-            ContentType='application/json',
-            # Metadata for tracking
-            Metadata={
-                'uploaded_at': datetime.now().isoformat(),
-                'source': 'cloud-iac-analyzer'
-            }
-        )
+        # Upload to S3, streaming the file as the request body. Binary mode
+        # skips a decode/re-encode round trip, and boto3 reads the handle in
+        # chunks instead of holding the whole report in memory.
+        with open(report_path, 'rb') as f:
+            response = s3_client.put_object(
+                Bucket=bucket_name,
+                Key=s3_key,
+                Body=f,
+                ContentType='application/json',
+                # Metadata for tracking
+                Metadata={
+                    'uploaded_at': datetime.now().isoformat(),
+                    'source': 'cloud-iac-analyzer'
+                }
+            )
         
         # Check if upload was successful
         status_code = response.get('ResponseMetadata', {}).get('HTTPStatusCode')
@@ -123,6 +150,58 @@ def upload_report_to_s3(
         return False
 
 
+def upload_reports_to_s3(
+    report_files: List[str],
+    bucket_name: str = "analyzer-reports",
+    s3_prefix: str = "reports/",
+    max_workers: int = 8
+) -> bool:
+    """
+    Upload several analysis reports to S3 concurrently.
+    
+    All uploads share one client (and so one connection pool), and run
+    on a thread pool since each upload is network-bound. Keys carry the
+    report's position in report_files as well as its file name, so
+    reports uploaded in the same second don't overwrite each other even
+    when two share a name (a/report.json and b/report.json).
+    
+    Args:
+        report_files: Paths to the report JSON files
+        bucket_name: Name of the S3 bucket
+        s3_prefix: S3 path prefix for organization
+        max_workers: Maximum number of concurrent uploads
+        
+    Returns:
+        True if every upload was successful, False otherwise
+    """
+    # Set up the shared client and bucket once, before the threads race for them
+    try:
+        get_s3_client()
+        ensure_bucket(bucket_name)
+    except ClientError as e:
+        print(f"[ERROR] AWS Client error ({e.response['Error']['Code']}): {e.response['Error']['Message']}")
+        return False
+    except Exception as e:
+        print(f"[ERROR] Unexpected error preparing upload: {str(e)}")
+        return False
+    
+    timestamp = datetime.now().strftime('%Y/%m/%d/%H-%M-%S')
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(
+                upload_report_to_s3,
+                report_file,
+                bucket_name,
+                s3_prefix,
+                f"{s3_prefix}analysis_{timestamp}_{index:03d}_{Path(report_file).stem}.json"
+            )
+            for index, report_file in enumerate(report_files)
+        ]
+        results = [future.result() for future in futures]
+    
+    return all(results)
+
+
 def main():
     """
     Main entry point for the S3 uploader.
@@ -132,6 +211,7 @@ def main():
     """
     # Get configuration from environment variables with defaults
     report_file = os.getenv('REPORT_FILE', '/app/output/report.json')
+    report_files = [f.strip() for f in os.getenv('REPORT_FILES', '').split(',') if f.strip()]
     bucket_name = os.getenv('S3_BUCKET', 'analyzer-reports')
     s3_prefix = os.getenv('S3_PREFIX', 'reports/')
     
@@ -139,8 +219,11 @@ def main():
     print("Cloud-to-IaC Analyzer - S3 Report Uploader")
     print("="*60 + "\n")
     
-    # Attempt to upload the report
-    success = upload_report_to_s3(report_file, bucket_name, s3_prefix)
+    # Attempt to upload the report(s)
+    if report_files:
+        success = upload_reports_to_s3(report_files, bucket_name, s3_prefix)
+    else:
+        success = upload_report_to_s3(report_file, bucket_name, s3_prefix)
     
     if success:
         print("\n" + "="*60)
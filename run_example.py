@@ -5,12 +5,13 @@ Runs the analyzer against the example files and prints a summary.
 
 import json
 import sys
+from collections import Counter
 from pathlib import Path
 
 # Ensure the package is importable when run directly from the project root
 sys.path.insert(0, str(Path(__file__).parent))
 
-from cloud_iac_analyzer import ResourceAnalyzer  # noqa: E402
+from cloud_iac_analyzer import ResourceAnalyzer, save_report  # noqa: E402
 
 
 def _print_results(report: list) -> None:
@@ -48,18 +49,16 @@ def main() -> int:
 
     report = ResourceAnalyzer(cloud_resources, iac_resources).analyze()
 
-    matched = sum(1 for r in report if r["State"] == "Match")
-    modified = sum(1 for r in report if r["State"] == "Modified")
-    missing = sum(1 for r in report if r["State"] == "Missing")
+    states = Counter(r["State"] for r in report)
+    matched, modified, missing = states["Match"], states["Modified"], states["Missing"]
 
     print(f"\nResults: {matched} match, {modified} modified, {missing} missing\n")
     _print_results(report)
 
     output_file = 'output/test_report.json'
     Path(output_file).parent.mkdir(exist_ok=True)
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2)
-    print(f"\nFull report written to {output_file}")
+    print()
+    save_report(report, output_file)
 
     return 0
 
@@ -9,6 +9,7 @@ or built and distributed with:
     python setup.py sdist bdist_wheel
 """
 
+import os
 from setuptools import setup, find_packages
 from pathlib import Path
 
@@ -34,6 +35,22 @@ if requirements_file.exists():
         and line.split("==")[0].strip() not in _DEV_PACKAGES
     ]
 
+# Optional ahead-of-time compilation of the diff engine with mypyc. Opt in with
+# CLOUD_IAC_ANALYZER_MYPYC=1; without it the package installs as plain Python with
+# identical behaviour. mypy is deliberately not a build requirement (every install
+# would pull it in), so an opted-in build must see the mypy already installed in
+# the current environment, i.e. run pip with --no-build-isolation.
+ext_modules = []
+if os.environ.get("CLOUD_IAC_ANALYZER_MYPYC") == "1":
+    try:
+        from mypyc.build import mypycify
+    except ImportError as e:
+        raise RuntimeError(
+            "CLOUD_IAC_ANALYZER_MYPYC=1 requires mypyc at build time: install mypy and "
+            "build with 'pip install --no-build-isolation .'"
+        ) from e
+    ext_modules = mypycify(["cloud_iac_analyzer/analyzer.py"])
+
 setup(
     name="cloud-iac-analyzer",
     version="1.0.0",
@@ -58,6 +75,7 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    ext_modules=ext_modules,
     entry_points={
         "console_scripts": [
             "cloud-iac-analyzer=cloud_iac_analyzer.cli:main",
@@ -15,10 +15,13 @@ Run with:
 
 import argparse
 import json
+import math
 import pytest
+from concurrent.futures.process import BrokenProcessPool
 from unittest.mock import patch
 
 from cloud_iac_analyzer.analyzer import (
+    Change,
     ResourceAnalyzer,
     load_json_file,
     save_report,
@@ -197,6 +200,39 @@ class TestPropertyComparison:
         assert entry["CloudValue"] == 80
         assert entry["IacValue"] == "80"
 
+    def test_shared_nested_block_reported_for_every_resource(self):
+        """A block object shared by several resources is diffed correctly for each."""
+        cloud_tags = {"Env": "prod", "Owner": "Alice"}
+        iac_tags   = {"Env": "staging", "Owner": "Alice"}
+        cloud = [{"id": "r1", "tags": cloud_tags}, {"id": "r2", "tags": cloud_tags}]
+        iac   = [{"id": "r1", "tags": iac_tags},   {"id": "r2", "tags": iac_tags}]
+        analyzer = make_analyzer(cloud, iac)
+        report = analyzer.analyze()
+        assert [change_keys(item) for item in report] == [{"tags.Env"}, {"tags.Env"}]
+        assert analyzer.analyze() == report
+
+    def test_repeated_comparisons_with_fresh_objects_are_independent(self):
+        """Verdicts must not leak between calls via recycled object ids."""
+        analyzer = make_analyzer([], [])
+        for v in (1, 2, 1, 2, 2):
+            state, _ = analyzer._compare_resources({"x": {"a": 1}}, {"x": {"a": v}})
+            assert state == ("Match" if v == 1 else "Modified")
+
+    def test_resource_type_mismatch_reports_only_type(self):
+        cloud = [{"id": "r1", "type": "aws_s3_bucket", "versioning": True, "acl": "private"}]
+        iac   = [{"id": "r1", "type": "aws_iam_role",  "assume_role_policy": "{}"}]
+        report = make_analyzer(cloud, iac).analyze()
+        assert report[0]["State"] == "Modified"
+        assert report[0]["ChangeLog"] == [
+            {"KeyName": "type", "CloudValue": "aws_s3_bucket", "IacValue": "aws_iam_role"}
+        ]
+
+    def test_type_declared_on_one_side_only_is_a_normal_diff(self):
+        cloud = [{"id": "r1", "size": "small"}]
+        iac   = [{"id": "r1", "type": "VPC", "size": "large"}]
+        report = make_analyzer(cloud, iac).analyze()
+        assert change_keys(report[0]) == {"type", "size"}
+
     def test_multiple_diffs_all_reported(self):
         cloud = [{"id": "r1", "version": "1.0", "class": "small", "zone": "us-east-1a"}]
         iac   = [{"id": "r1", "version": "2.0", "class": "xlarge", "zone": "us-east-1a"}]
@@ -276,6 +312,62 @@ class TestArrayComparison:
         assert report[0]["State"] == "Match"
         assert report[0]["ChangeLog"] == []
 
+    def test_inserted_element_reported_once_not_as_shifted_indices(self):
+        """An element inserted at the front is one change, not one per later index."""
+        cloud = [{"id": "r1", "ports": [80, 443, 8080]}]
+        iac   = [{"id": "r1", "ports": [22, 80, 443, 8080]}]
+        report = make_analyzer(cloud, iac).analyze()
+        assert report[0]["ChangeLog"] == [{"KeyName": "ports[0]", "CloudValue": None, "IacValue": 22}]
+
+    def test_removed_element_in_middle_reported_once(self):
+        cloud = [{"id": "r1", "rules": [{"port": 80}, {"port": 22}, {"port": 443}]}]
+        iac   = [{"id": "r1", "rules": [{"port": 80}, {"port": 443}]}]
+        report = make_analyzer(cloud, iac).analyze()
+        assert report[0]["ChangeLog"] == [
+            {"KeyName": "rules[1]", "CloudValue": {"port": 22}, "IacValue": None}
+        ]
+
+    def test_single_surviving_element_reports_only_removals(self):
+        """Several elements against one still aligns the survivor rather than replacing it."""
+        cloud = [{"id": "r1", "l": ["a", "b", "c"]}]
+        iac   = [{"id": "r1", "l": ["b"]}]
+        report = make_analyzer(cloud, iac).analyze()
+        assert report[0]["ChangeLog"] == [
+            {"KeyName": "l[0]", "CloudValue": "a", "IacValue": None},
+            {"KeyName": "l[2]", "CloudValue": "c", "IacValue": None},
+        ]
+
+    def test_unordered_array_numerically_equal_elements_match(self):
+        """Elements that are equal by == (1 vs 1.0) are not reported as removed and added."""
+        cloud = [{"id": "r1", "tags": [{"Key": "ttl", "Value": 1}, "x"]}]
+        iac   = [{"id": "r1", "tags": [{"Key": "ttl", "Value": 1.0}, "y"]}]
+        report = make_analyzer(cloud, iac).analyze()
+        assert report[0]["ChangeLog"] == [
+            {"KeyName": "tags[1]", "CloudValue": "x", "IacValue": None},
+            {"KeyName": "tags[1]", "CloudValue": None, "IacValue": "y"},
+        ]
+
+    def test_reordered_unordered_array_is_a_match(self):
+        cloud = [{"id": "r1", "cidr_blocks": ["10.0.0.0/8", "192.168.0.0/16"]}]
+        iac   = [{"id": "r1", "cidr_blocks": ["192.168.0.0/16", "10.0.0.0/8"]}]
+        report = make_analyzer(cloud, iac).analyze()
+        assert report[0]["State"] == "Match"
+
+    def test_unordered_array_reports_removed_and_added_elements(self):
+        cloud = [{"id": "r1", "tags": [{"Key": "Env", "Value": "prod"}, {"Key": "Team", "Value": "a"}]}]
+        iac   = [{"id": "r1", "tags": [{"Key": "Team", "Value": "a"}, {"Key": "Env", "Value": "dev"}]}]
+        report = make_analyzer(cloud, iac).analyze()
+        assert report[0]["ChangeLog"] == [
+            {"KeyName": "tags[0]", "CloudValue": {"Key": "Env", "Value": "prod"}, "IacValue": None},
+            {"KeyName": "tags[1]", "CloudValue": None, "IacValue": {"Key": "Env", "Value": "dev"}},
+        ]
+
+    def test_unordered_keys_are_configurable(self):
+        cloud = [{"id": "r1", "zones": ["a", "b"], "cidr_blocks": ["x", "y"]}]
+        iac   = [{"id": "r1", "zones": ["b", "a"], "cidr_blocks": ["y", "x"]}]
+        report = ResourceAnalyzer(cloud, iac, unordered_keys={"zones"}).analyze()
+        assert change_keys(report[0]) == {"cidr_blocks[0]", "cidr_blocks[1]"}
+
     def test_deeply_nested_array_path(self):
         """security_groups[0].rules[1].port — three segments with two brackets."""
         cloud = [{"id": "r1", "security_groups": [
@@ -342,7 +434,7 @@ class TestEdgeCases:
         iac   = [{"size": "large", "region": "us-west-2"}]
         report = make_analyzer(cloud, iac).analyze()
         assert len(report) == 1
-        # cloud resource has no id/name → _find_matching_iac_resource returns None
+        # cloud resource has no id/name → no IaC index lookup can match it
         assert report[0]["State"] == "Missing"
 
     def test_multiple_resources_mixed_states(self):
@@ -361,6 +453,33 @@ class TestEdgeCases:
         assert states["r2"] == "Modified"
         assert states["r3"] == "Missing"
 
+    def test_parallel_analysis_matches_serial(self):
+        """Diffing in worker processes yields the same report, in the same order."""
+        cloud = [{"id": f"r{i}", "size": "small", "tags": {"Env": "prod", "Index": i}}
+                 for i in range(12)]
+        iac   = [{"id": f"r{i}", "size": "small" if i % 3 else "large",
+                  "tags": {"Env": "prod", "Index": i}} for i in range(10)]
+        serial = make_analyzer(cloud, iac).analyze()
+        parallel = ResourceAnalyzer(cloud, iac, parallel_threshold=0, max_workers=2).analyze()
+        assert parallel == serial
+        assert all(p["CloudResourceItem"] is c for p, c in zip(parallel, cloud))
+        assert parallel[3]["IacResourceItem"] is iac[3]
+
+    def test_broken_process_pool_falls_back_to_serial(self):
+        cloud = [{"id": f"r{i}", "size": "small"} for i in range(4)]
+        iac   = [{"id": f"r{i}", "size": "large" if i % 2 else "small"} for i in range(4)]
+        serial = make_analyzer(cloud, iac).analyze()
+        with patch("cloud_iac_analyzer.analyzer.ProcessPoolExecutor",
+                   side_effect=BrokenProcessPool("worker died")):
+            parallel = ResourceAnalyzer(cloud, iac, parallel_threshold=0).analyze()
+        assert parallel == serial
+
+    def test_iter_analyze_yields_same_items_as_analyze(self):
+        cloud = [{"id": "r1", "v": 1}, {"id": "r2", "v": 1}, {"name": "n3"}]
+        iac   = [{"id": "r1", "v": 1}, {"id": "r2", "v": 2}]
+        analyzer = make_analyzer(cloud, iac)
+        assert list(analyzer.iter_analyze()) == analyzer.analyze()
+
     def test_analyze_resets_report_on_each_call(self):
         """Calling analyze() twice on the same instance does not accumulate results."""
         cloud = [{"id": "r1"}]
@@ -440,6 +559,22 @@ class TestReportFormat:
         for entry in report[0]["ChangeLog"]:
             assert set(entry.keys()) == {"KeyName", "CloudValue", "IacValue"}
 
+    def test_changelog_entries_behave_like_read_only_dicts(self):
+        change = Change("tags.Env", "prod", None)
+        assert change == {"KeyName": "tags.Env", "CloudValue": "prod", "IacValue": None}
+        assert dict(change) == change.to_dict()
+        assert change.get("IacValue", "absent") is None
+        with pytest.raises(KeyError):
+            change["Other"]
+
+    def test_saved_changelog_entries_are_plain_json_objects(self, tmp_path):
+        cloud = [{"id": "r1", "v": 1}]
+        iac   = [{"id": "r1", "v": 2}]
+        out = tmp_path / "report.json"
+        save_report(make_analyzer(cloud, iac).analyze(), str(out))
+        saved = json.loads(out.read_text())
+        assert saved[0]["ChangeLog"] == [{"KeyName": "v", "CloudValue": 1, "IacValue": 2}]
+
     def test_cloud_resource_item_references_original_object(self):
         """CloudResourceItem should be the original dict, not a copy."""
         resource = {"id": "r1", "data": "original"}
@@ -495,6 +630,18 @@ class TestLoadJsonFile:
         f.write_text("[]")
         assert load_json_file(str(f)) == []
 
+    def test_loads_integers_wider_than_64_bits_exactly(self, tmp_path):
+        f = tmp_path / "big.json"
+        f.write_text(f'[{{"n": {2**70}}}]')
+        loaded = load_json_file(str(f))
+        assert loaded == [{"n": 2**70}]
+        assert isinstance(loaded[0]["n"], int)
+
+    def test_loads_nan(self, tmp_path):
+        f = tmp_path / "nan.json"
+        f.write_text('[{"n": NaN}]')
+        assert math.isnan(load_json_file(str(f))[0]["n"])
+
 
 # ---------------------------------------------------------------------------
 # 7.  save_report
@@ -516,6 +663,59 @@ class TestSaveReport:
         loaded = json.loads(out.read_text())
         assert loaded == report
 
+    def test_saves_with_stdlib_json_when_orjson_missing(self, tmp_path):
+        report = [{"CloudResourceItem": {"id": "r1"}, "IacResourceItem": {},
+                   "State": "Missing", "ChangeLog": []}]
+        out = tmp_path / "report.json"
+        with patch("cloud_iac_analyzer.analyzer.orjson", None):
+            save_report(report, str(out))
+        assert json.loads(out.read_text()) == report
+
+    def test_saves_values_orjson_cannot_encode(self, tmp_path):
+        """Integers wider than 64 bits fall back to stdlib json instead of failing."""
+        report = [{"CloudResourceItem": {"id": "r1", "size": 2 ** 70},
+                   "IacResourceItem": {}, "State": "Missing", "ChangeLog": []}]
+        out = tmp_path / "report.json"
+        save_report(report, str(out))
+        assert json.loads(out.read_text()) == report
+
+    def test_saves_non_finite_floats_like_stdlib_json(self, tmp_path):
+        """NaN and Infinity are written as such, not turned into null."""
+        cloud = [{"id": "r1", "v": float("nan"), "w": float("inf")}]
+        iac   = [{"id": "r1", "v": 1.0, "w": 2}]
+        out = tmp_path / "report.json"
+        save_report(make_analyzer(cloud, iac).iter_analyze(), str(out))
+        item = json.loads(out.read_text())[0]
+        assert math.isnan(item["CloudResourceItem"]["v"])
+        assert item["CloudResourceItem"]["w"] == float("inf")
+        changes = {c["KeyName"]: c for c in item["ChangeLog"]}
+        assert math.isnan(changes["v"]["CloudValue"])
+        assert changes["w"]["CloudValue"] == float("inf")
+
+    def test_streams_items_from_a_generator(self, tmp_path):
+        cloud = [{"id": "r1", "v": 1}, {"id": "r2", "v": 1e16}, {"id": "r3", "name": "café"}]
+        iac   = [{"id": "r1", "v": 1}, {"id": "r2", "v": 2}]
+        out = tmp_path / "report.json"
+        save_report(make_analyzer(cloud, iac).iter_analyze(), str(out))
+        expected = json.dumps(make_analyzer(cloud, iac).analyze(), indent=2,
+                              default=lambda change: change.to_dict())
+        assert json.loads(out.read_text(encoding="utf-8")) == json.loads(expected)
+
+    def test_streamed_layout_matches_indented_dump(self, tmp_path):
+        # ASCII strings and ints are spelled identically by orjson and stdlib json.
+        cloud = [{"id": "r1", "v": 1}, {"id": "r2", "v": 1}, {"id": "r3"}]
+        iac   = [{"id": "r1", "v": 1}, {"id": "r2", "v": 2}]
+        out = tmp_path / "report.json"
+        save_report(make_analyzer(cloud, iac).iter_analyze(), str(out))
+        expected = json.dumps(make_analyzer(cloud, iac).analyze(), indent=2,
+                              default=lambda change: change.to_dict())
+        assert out.read_text(encoding="utf-8") == expected
+
+    def test_saves_empty_report_as_empty_array(self, tmp_path):
+        out = tmp_path / "report.json"
+        save_report(iter([]), str(out))
+        assert out.read_text() == "[]"
+
     def test_raises_io_error_for_unwritable_path(self, tmp_path):
         bad_path = str(tmp_path / "no_such_dir" / "report.json")
         with pytest.raises(IOError):
@@ -579,6 +779,19 @@ class TestGenerateAnalysisReport:
         assert "1 modified" in captured.out
         assert "1 missing" in captured.out
 
+    def test_end_to_end_without_keeping_report(self, tmp_path, capsys):
+        cloud_f = tmp_path / "cloud.json"
+        iac_f   = tmp_path / "iac.json"
+        out_f   = tmp_path / "report.json"
+        cloud_f.write_text(json.dumps([{"id": "r1", "v": 1}, {"id": "r2"}]))
+        iac_f.write_text(json.dumps([{"id": "r1", "v": 2}]))
+
+        result = generate_analysis_report(str(cloud_f), str(iac_f), str(out_f), keep_report=False)
+
+        assert result is None
+        assert [item["State"] for item in json.loads(out_f.read_text())] == ["Modified", "Missing"]
+        assert "Analyzed 2 resources" in capsys.readouterr().out
+
 
 # ---------------------------------------------------------------------------
 # 9.  CLI — validate_input_file, validate_output_path, main()